@@ -1,5 +1,5 @@
 import pytest
-from ..common.utils import parse_bool_arg
+from ..common.utils import parse_bool_arg, CompiledModelCache
 
 
 def pytest_addoption(parser):
@@ -15,3 +15,14 @@ def backend(request):
 @pytest.fixture(scope="session")
 def dynamic(request):
     return request.config.getoption("--dynamic")
+
+
+@pytest.fixture(scope="session")
+def compiled_model_cache():
+    return CompiledModelCache()
+
+
+@pytest.fixture(scope="module")
+def compiled_model(request, compiled_model_cache, backend, dynamic):
+    # compiles the eager `model` defined by the requesting test module
+    return compiled_model_cache.get(request.module.model, backend, dynamic)
@@ -46,6 +46,21 @@ def compile_model(model, backend, dynamic=False):
     return [CompiledModel(static_model, False)]
 
 
+class CompiledModelCache():
+    def __init__(self):
+        self.compiled_models = {}
+
+    def get(self, model, backend, dynamic=False):
+        # compile once per session, shape changes are left to dynamo guards
+        # instead of resetting dynamo before every test. dynamo is not reset
+        # here either, that would drop the code of the models already cached
+        update_dynamo_config(dynamic)
+        key = (type(model), backend, dynamic)
+        if key not in self.compiled_models:
+            self.compiled_models[key] = compile_model(model, backend, dynamic)[0]
+        return self.compiled_models[key]
+
+
 def parse_bool_arg(arg):
     if isinstance(arg, bool):
         return arg
@@ -1 +1 @@
-from ..common.conftest import pytest_addoption, backend, dynamic # noqa F401
+from ..common.conftest import pytest_addoption, backend, dynamic, compiled_model_cache, compiled_model # noqa F401
@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -17,15 +15,12 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestAdaptiveAvgPool2dBackward():
     @pytest.mark.parametrize("dtype", [torch.float32])
     @pytest.mark.parametrize("sizes", [Size(((8, 16, 32, 64), (8, 16, 1, 1)), ((8, 16, 32, 64), (8, 16, 1, 1))),
                                        Size(((20, 16, 50, 100), (20, 16, 1, 1)), ((20, 16, 50, 100), (20, 16, 1, 1)))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch__adpative_avg_pool2d_backward(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
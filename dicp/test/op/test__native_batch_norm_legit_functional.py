@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -19,15 +17,12 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestNativeBatchNormLegitFunctional():
     @pytest.mark.parametrize("dtype", [torch.float32])
     @pytest.mark.parametrize("sizes", [Size((20, 100, 35, 45), (20, 100, 35, 45)),
                                        Size((30, 100, 45, 35), (30, 100, 45, 35))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch__native_batch_norm_legit_functional(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -19,14 +17,11 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestSoftmax():
     @pytest.mark.parametrize("dtype", [torch.float32])
     @pytest.mark.parametrize("sizes", [Size((5,), (5, 3)), Size((3, 5), (5, 3)), Size((2, 3, 4), (2, 4))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch__softmax(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     update_dynamo_config,
 )
 
@@ -16,14 +14,11 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestArange():
     @pytest.mark.parametrize("start", [0, 1, 2])
     @pytest.mark.parametrize("end", [5, 7, 9])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_arange(self, start, end, compiled_model):
         output = model(start, end)
         dynamo.reset()
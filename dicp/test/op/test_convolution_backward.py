@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -20,15 +18,12 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestConvolutionBackward():
     @pytest.mark.parametrize("dtype", [torch.float32])
     @pytest.mark.parametrize("sizes", [Size(((32, 2048, 7, 7), (32, 512, 7, 7), (2048, 512, 1, 1)),
                                             ((32, 2048, 7, 7), (32, 512, 7, 7), (2048, 512, 1, 1)))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_convolution_backward(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
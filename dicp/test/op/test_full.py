@@ -3,8 +3,6 @@ from ..common.utils import (
     torch,
     dynamo,
     random,
-    parse_args,
-    compile_model,
     Size,
     update_dynamo_config,
 )
@@ -17,14 +15,11 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestFull():
     @pytest.mark.parametrize("dtype", [torch.float32])
     @pytest.mark.parametrize("sizes", [Size((5,), (5, 3)), Size((3, 5), (5, 3)), Size((2, 3, 4), (2, 4))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_full(self, sizes, dtype, compiled_model):
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
         value = round(random.random(), 4)
@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -17,8 +15,6 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestGroupNorm():
@@ -28,7 +24,6 @@ class TestGroupNorm():
                                        Size(((2, 640, 32, 32), (640,), (640)),
                                             ((2, 640, 32, 32), (640,), (640)))])
     @pytest.mark.parametrize("groups", [32])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_group_norm(self, sizes, groups, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
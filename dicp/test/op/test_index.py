@@ -3,7 +3,6 @@ from ..common.utils import (
     torch,
     dynamo,
     parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -18,7 +17,6 @@ class OpModule(torch.nn.Module):
 
 model = OpModule()
 args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestIndex():
@@ -26,7 +24,6 @@ class TestIndex():
                         reason="This is the test case for index in ascendgraph!")
     @pytest.mark.parametrize("dtype", [torch.float32])
     @pytest.mark.parametrize("sizes", [Size((5, 3), (5, 3)), Size((3, 5), (5, 3)), Size((4, 2), (4, 2))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_index_ascend(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
@@ -49,7 +46,6 @@ class TestIndex():
                                        Size(((10, 15, 20), (None, (1, 2), (3, 1))), ((10, 20), (None, (2,)))),
                                        Size(((10, 15, 20, 25, 30), (None, (10, 1, 2), (10, 3, 1), None, None)),
                                             ((25, 25), (None, (2,))))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_index_tops(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     update_dynamo_config,
 )
 
@@ -15,15 +13,12 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestIota():
     @pytest.mark.parametrize("length", [8, 16])
     @pytest.mark.parametrize("start", [0, 2])
     @pytest.mark.parametrize("step", [5, 9])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_iota(self, length, start, step, compiled_model):
         output = model(length, start, step)
         dynamo.reset()
@@ -4,8 +4,6 @@ from dicp.vendor.AscendGraph import ext_ops
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -19,14 +17,11 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestLightllmCopyWithOffset():
     @pytest.mark.parametrize("dtype", [torch.float32])
     @pytest.mark.parametrize("sizes", [Size(((8, 8, 16), (6, 8, 16)), ((8, 8, 16), (6, 8, 16))), Size(((8, 16, 32), (6, 16, 32)), ((8, 16, 32), (6, 16, 32)))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_lighllm_copy_with_offset(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
@@ -4,8 +4,6 @@ from dicp.vendor.AscendGraph import ext_ops
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -19,14 +17,11 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestLightllmPromptAttention():
     @pytest.mark.parametrize("dtype", [torch.float16])
     @pytest.mark.parametrize("sizes", [Size(((1, 32, 16, 32), (32,)), ((1, 32, 16, 32), (32,))), Size(((1, 32, 16, 64), (32,)), ((1, 32, 16, 64), (32,)))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_lightllm_prompt_attention(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
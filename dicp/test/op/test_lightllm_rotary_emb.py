@@ -3,44 +3,148 @@ import pytest
 from dicp.vendor.AscendGraph import ext_ops
 from ..common.utils import (
     torch,
-    dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
-    update_dynamo_config,
 )
 
 
 class OpModule(torch.nn.Module):
-    def forward(self, x, cos, sin):
+    def forward(self, x, cos, sin, inplace=False):
+        if inplace:
+            return torch.ops.lightllm.rotary_emb_.default(x, cos, sin)
         res = torch.ops.lightllm.rotary_emb.default(x, cos, sin)
         return res
 
 
+class OpModule2(torch.nn.Module):
+    def forward(self, q, k, w_q, w_k, cos, sin, eps):
+        q2, k2 = torch.ops.lightllm.qk_rmsnorm_rope.default(q, k, w_q, w_k, cos, sin, eps)
+        return q2, k2
+
+
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
+model2 = OpModule2()
+
+
+def rotary_emb_ref(x, cos, sin):
+    seq_len, _, dim = x.shape
+    # tile cos/sin to the full head dim, the same as the RotaryMul lowering
+    cos = cos.view((seq_len, 1, dim // 2))
+    sin = sin.view((seq_len, 1, dim // 2))
+    cos = torch.cat((cos, cos), dim=-1)
+    sin = torch.cat((sin, sin), dim=-1)
+    x0, x1 = x.chunk(2, dim=-1)
+    rotate_half_x = torch.cat((-x1, x0), dim=-1)
+    return x * cos + rotate_half_x * sin
+
+
+def rms_norm_ref(x, weight, eps):
+    return x * torch.rsqrt(x.pow(2).mean(-1, keepdim=True) + eps) * weight
+
+
+@pytest.fixture(scope="module")
+def compiled_model2(compiled_model_cache, backend, dynamic):
+    return compiled_model_cache.get(model2, backend, dynamic)
+
+
+@pytest.fixture(scope="session")
+def rotary_buffers():
+    # allocate cpu/device inputs once per size, tests refill them in place
+    buffers = {}
+
+    def get_buffers(size, dtype, device):
+        key = (size, dtype)
+        if key not in buffers:
+            cpu_buffers = tuple(torch.empty(s, dtype=dtype) for s in size)
+            dicp_buffers = tuple(torch.empty(s, dtype=dtype, device=device) for s in size)
+            buffers[key] = (cpu_buffers, dicp_buffers)
+        return buffers[key]
+
+    return get_buffers
 
 
 class TestLightllmRotaryEmb():
     @pytest.mark.parametrize("dtype", [torch.float32])
     @pytest.mark.parametrize("sizes", [Size(((2, 32, 64), (2, 32), (2, 32)), ((2, 32, 64), (2, 32), (2, 32))), Size(((2, 32, 128), (2, 64), (2, 64)), ((2, 32, 128), (2, 64), (2, 64)))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
-    def test_lightllm_rotary_emb(self, sizes, dtype, compiled_model):
+    @pytest.mark.parametrize("inplace", [False, True])
+    def test_lightllm_rotary_emb(self, sizes, dtype, inplace, compiled_model, rotary_buffers):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
-        input1 = torch.randn(size[0], dtype=dtype)
-        input2 = torch.randn(size[1], dtype=dtype)
-        input3 = torch.randn(size[2], dtype=dtype)
+        inputs, dicp_inputs = rotary_buffers(size, dtype, device)
+        for input, dicp_input in zip(inputs, dicp_inputs):
+            input.normal_()
+            dicp_input.copy_(input)
+        input1, input2, input3 = inputs
+        dicp_input1, dicp_input2, dicp_input3 = dicp_inputs
 
-        dicp_input1 = input1.to(device)
-        dicp_input2 = input2.to(device)
-        dicp_input3 = input3.to(device)
-
-        output = model(input1, input2, input3)
-        dynamo.reset()
-        update_dynamo_config(compiled_model.dynamic)
-        dicp_output = compiled_model.model(dicp_input1, dicp_input2, dicp_input3)
+        output = rotary_emb_ref(input1, input2, input3)
+        dicp_output = compiled_model.model(dicp_input1, dicp_input2, dicp_input3, inplace)
 
         assert torch.allclose(output, dicp_output.cpu(), rtol=1e-02, atol=1e-02, equal_nan=True)
+        if inplace:
+            assert torch.allclose(output, dicp_input1.cpu(), rtol=1e-02, atol=1e-02, equal_nan=True)
+
+    @pytest.mark.parametrize("dtype", [torch.float32])
+    @pytest.mark.parametrize("sizes", [Size(((2, 32, 64), (2, 32, 64), (64,), (64,), (2, 32), (2, 32)), ((2, 32, 64), (2, 32, 64), (64,), (64,), (2, 32), (2, 32))), Size(((2, 32, 128), (2, 8, 128), (128,), (128,), (2, 64), (2, 64)), ((2, 32, 128), (2, 8, 128), (128,), (128,), (2, 64), (2, 64)))])
+    def test_lightllm_qk_rmsnorm_rope(self, sizes, dtype, compiled_model2, rotary_buffers):
+        device = get_device()
+        size = sizes.dynamic if compiled_model2.dynamic else sizes.static
+        inputs, dicp_inputs = rotary_buffers(size, dtype, device)
+        for input, dicp_input in zip(inputs, dicp_inputs):
+            input.normal_()
+            dicp_input.copy_(input)
+        q, k, w_q, w_k, cos, sin = inputs
+        eps = 1e-6
+
+        q_output = rotary_emb_ref(rms_norm_ref(q, w_q, eps), cos, sin)
+        k_output = rotary_emb_ref(rms_norm_ref(k, w_k, eps), cos, sin)
+        dicp_q_output, dicp_k_output = compiled_model2.model(*dicp_inputs, eps)
+
+        assert torch.allclose(q_output, dicp_q_output.cpu(), rtol=1e-02, atol=1e-02, equal_nan=True)
+        assert torch.allclose(k_output, dicp_k_output.cpu(), rtol=1e-02, atol=1e-02, equal_nan=True)
+
+    # the compiled models above lower the ops to the backend graph, so the eager
+    # cpu kernels are only checked here
+    @pytest.mark.parametrize("dtype", [torch.float32])
+    @pytest.mark.parametrize("size", [((2, 32, 64), (2, 32), (2, 32)), ((2, 32, 128), (2, 64), (2, 64))])
+    def test_lightllm_rotary_emb_eager(self, size, dtype):
+        x, cos, sin = (torch.randn(s, dtype=dtype) for s in size)
+        output = rotary_emb_ref(x, cos, sin)
+
+        eager_output = torch.ops.lightllm.rotary_emb.default(x, cos, sin)
+        assert torch.allclose(output, eager_output, rtol=1e-05, atol=1e-05)
+
+        eager_input = x.clone()
+        eager_output = torch.ops.lightllm.rotary_emb_.default(eager_input, cos, sin)
+        assert torch.allclose(output, eager_output, rtol=1e-05, atol=1e-05)
+        assert torch.allclose(output, eager_input, rtol=1e-05, atol=1e-05)
+
+    @pytest.mark.parametrize("dtype", [torch.float32])
+    @pytest.mark.parametrize("size", [((2, 32, 64), (2, 32, 64), (64,), (64,), (2, 32), (2, 32)), ((2, 32, 128), (2, 8, 128), (128,), (128,), (2, 64), (2, 64))])
+    def test_lightllm_qk_rmsnorm_rope_eager(self, size, dtype):
+        q, k, w_q, w_k, cos, sin = (torch.randn(s, dtype=dtype) for s in size)
+        eps = 1e-6
+
+        q_output = rotary_emb_ref(rms_norm_ref(q, w_q, eps), cos, sin)
+        k_output = rotary_emb_ref(rms_norm_ref(k, w_k, eps), cos, sin)
+        eager_q_output, eager_k_output = torch.ops.lightllm.qk_rmsnorm_rope.default(q, k, w_q, w_k, cos, sin, eps)
+
+        assert torch.allclose(q_output, eager_q_output, rtol=1e-05, atol=1e-05)
+        assert torch.allclose(k_output, eager_k_output, rtol=1e-05, atol=1e-05)
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="cuda is not available")
+    @pytest.mark.parametrize("dtype", [torch.float32, torch.float16])
+    @pytest.mark.parametrize("size", [((2, 32, 64), (2, 32), (2, 32)), ((2, 32, 128), (2, 64), (2, 64))])
+    def test_lightllm_rotary_emb_flash_attn(self, size, dtype):
+        pytest.importorskip("flash_attn")
+        x_size, cos_size, sin_size = size
+        # cos/sin stay float32 so that mixed dtypes are covered as well
+        x = torch.randn(x_size, dtype=dtype)
+        cos = torch.randn(cos_size, dtype=torch.float32)
+        sin = torch.randn(sin_size, dtype=torch.float32)
+        output = rotary_emb_ref(x.float(), cos, sin)
+
+        cuda_output = torch.ops.lightllm.rotary_emb.default(x.cuda(), cos.cuda(), sin.cuda())
+
+        assert cuda_output.dtype == dtype
+        assert torch.allclose(output, cuda_output.cpu().float(), rtol=1e-02, atol=1e-02)
@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -20,14 +18,11 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestMaxPool2dWithIndicesBackward():
     @pytest.mark.parametrize("dtype", [torch.float32])
     @pytest.mark.parametrize("sizes", [Size(((32, 64, 56, 56), (32, 64, 112, 112)), ((32, 64, 56, 56), (32, 64, 112, 112)))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_max_pool2d_with_indices_backward(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -17,8 +15,6 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestNativeLayerNorm():
@@ -28,7 +24,6 @@ class TestNativeLayerNorm():
                                        Size(((2, 1024, 640), (640,), (640)),
                                             ((2, 1024, 640), (640,), (640)))])
     @pytest.mark.parametrize("eps", [1e-05])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_native_layer_norm(self, sizes, eps, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -17,8 +15,6 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestPermute():
@@ -26,7 +22,6 @@ class TestPermute():
     @pytest.mark.parametrize("sizes", [Size(((5, 3), (0, 1)), ((5, 3), (0, 1))),
                                        Size(((3, 5, 7), (0, 2, 1)), ((5, 3), (0, 1))),
                                        Size(((2, 3, 4, 8), (3, 0, 2, 1)), ((2, 4), (0, 1)))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_permute(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
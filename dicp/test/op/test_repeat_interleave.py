@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -17,8 +15,6 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestRepeat():
@@ -26,7 +22,6 @@ class TestRepeat():
     @pytest.mark.parametrize("sizes", [Size(((3, 5), 5, 0), ((3, 5), 5, 0)),
                                        Size(((4, 6, 8), 2, 1), ((4, 6, 8), 2, 1)),
                                        Size(((4, 3, 2, 2), 3, -1), ((4, 3, 2, 2), 3, -1))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_repeat_self_int(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
@@ -3,7 +3,6 @@ from ..common.utils import (
     torch,
     dynamo,
     parse_args,
-    compile_model,
     update_dynamo_config,
 )
 
@@ -29,15 +28,17 @@ class AscendOpModule(torch.nn.Module):
 model = OpModule()
 ascend_model = AscendOpModule()
 args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
-ascend_compiled_model = compile_model(ascend_model, args.backend, args.dynamic)
+
+
+@pytest.fixture(scope="module")
+def ascend_compiled_model(compiled_model_cache, backend, dynamic):
+    return compiled_model_cache.get(ascend_model, backend, dynamic)
 
 
 class TestScalarTensor():
     @pytest.mark.skipif(args.backend == 'ascendgraph', reason="skip ascendgraph")
     @pytest.mark.parametrize("dtype", [torch.float32, torch.int64, torch.float16])
     @pytest.mark.parametrize("inputs", [1.0, 3.0, 0.0])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_scalar_tensor(self, inputs, dtype, compiled_model):
         output = model(inputs, dtype)
         dynamo.reset()
@@ -49,12 +50,11 @@ class TestScalarTensor():
     @pytest.mark.skipif(args.backend == 'topsgraph', reason="skip topsgraph")
     @pytest.mark.parametrize("dtype", [torch.float32, torch.int64, torch.float16])
     @pytest.mark.parametrize("inputs", [1.0, 2.0, 3.0])
-    @pytest.mark.parametrize("compiled_model", ascend_compiled_model)
-    def test_torch_ascend_scalar_tensor(self, inputs, dtype, compiled_model):
+    def test_torch_ascend_scalar_tensor(self, inputs, dtype, ascend_compiled_model):
         redundant_input = torch.ones(1, dtype=dtype)
         output, _ = ascend_model(inputs, redundant_input, dtype)
         dynamo.reset()
-        update_dynamo_config(compiled_model.dynamic)
-        dicp_output, _ = compiled_model.model(inputs, redundant_input, dtype)
+        update_dynamo_config(ascend_compiled_model.dynamic)
+        dicp_output, _ = ascend_compiled_model.model(inputs, redundant_input, dtype)
 
         assert torch.allclose(output, dicp_output.cpu(), equal_nan=True)
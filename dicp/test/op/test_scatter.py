@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -17,15 +15,12 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestScatter():
     @pytest.mark.parametrize("dtype", [torch.float32])
     @pytest.mark.parametrize("sizes", [Size(((5,), (0, 2)), ((5, 3), ((0, 2), (0, 2)))),
                                        Size(((3, 5), ((0, 2), (0, 2))), ((5, 3), ((0, 2), (0, 2))))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_scatter(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -18,8 +16,6 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestSlice():
@@ -30,7 +26,6 @@ class TestSlice():
     @pytest.mark.parametrize("dim", [0, -1])
     @pytest.mark.parametrize("start", [0, 1, None])
     @pytest.mark.parametrize("end", [2, None])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_slice(self, sizes, dim, start, end, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
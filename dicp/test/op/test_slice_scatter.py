@@ -3,7 +3,6 @@ from ..common.utils import (
     torch,
     dynamo,
     parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -19,7 +18,6 @@ class OpModule(torch.nn.Module):
 
 model = OpModule()
 args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 def torch_slice_scatter_test_base(sizes, dtype, compiled_model):
@@ -49,7 +47,6 @@ class TestSliceScatter():
                                             ((1, 32, 208, 128), (1, 32, 208, 128), 0, 0, 9223372036854775807, 1)),
                                        Size(((1, 32, 208, 128), (1, 32, 208, 128), 1, 0, 9223372036854775807, 1),
                                             ((1, 32, 208, 128), (1, 32, 208, 128), 1, 0, 9223372036854775807, 1))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_slice_scatter_ascend(self, sizes, dtype, compiled_model):
         torch_slice_scatter_test_base(sizes, dtype, compiled_model)
 
@@ -58,6 +55,5 @@ class TestSliceScatter():
                                        Size(((32, 16), (32, 14), 1, 2, 16, 1), ((32, 16), (32, 14), 1, 2, 16, 1)),
                                        Size(((32, 64, 16), (32, 64, 14), 2, 2, 16, 1),
                                             ((32, 64), (33, 62), 2, 2, 16, 1))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_slice_scatter_all(self, sizes, dtype, compiled_model):
         torch_slice_scatter_test_base(sizes, dtype, compiled_model)
@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -17,8 +15,6 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestSqueeze():
@@ -27,7 +23,6 @@ class TestSqueeze():
                                        Size((3, 1, 4), (5, 1)),
                                        Size((2, 1, 3, 4), (2, 1))])
     @pytest.mark.parametrize("dim", [1])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_squeeze(self, sizes, dim, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
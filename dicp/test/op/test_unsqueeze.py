@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -17,8 +15,6 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestUnsqueeze():
@@ -26,7 +22,6 @@ class TestUnsqueeze():
     @pytest.mark.parametrize("sizes", [Size(5, (2, 4)), Size((5,), (5, 3)),
                                        Size((3, 5), (5, 3)), Size((2, 3, 4), (2, 4))])
     @pytest.mark.parametrize("dim", [0, 1, -1])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_unsqueeze(self, sizes, dim, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -17,8 +15,6 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestVarMean():
@@ -27,7 +23,6 @@ class TestVarMean():
     @pytest.mark.parametrize("sizes", [Size((77, 1027), (77, 1024)),
                                        Size((4, 77, 1024), (4, 1024)),
                                        Size((2, 32, 10, 9216), (4, 77))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_var_mean(self, sizes, dtype, dim, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
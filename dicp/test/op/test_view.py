@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -17,8 +15,6 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestView():
@@ -29,7 +25,6 @@ class TestView():
                                        Size(((5, 3), (3, -1)), ((5, 3), (3, -1))),
                                        Size(((2, 8), (16,)), ((2, 8), (16,))),
                                        Size(((2, 8), (2, 4, 2)), ((2, 8), (2, 4, 2)))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_view(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
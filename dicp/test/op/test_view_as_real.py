@@ -2,8 +2,6 @@ import pytest
 from ..common.utils import (
     torch,
     dynamo,
-    parse_args,
-    compile_model,
     get_device,
     Size,
     update_dynamo_config,
@@ -18,14 +16,11 @@ class OpModule(torch.nn.Module):
 
 
 model = OpModule()
-args = parse_args()
-compiled_model = compile_model(model, args.backend, args.dynamic)
 
 
 class TestViewAsReal():
     @pytest.mark.parametrize("dtype", [torch.float])
     @pytest.mark.parametrize("sizes", [Size((2), (5, 2)), Size((3, 2), (3, 2)), Size((3, 4, 2), (4, 2))])
-    @pytest.mark.parametrize("compiled_model", compiled_model)
     def test_torch_view_as_real(self, sizes, dtype, compiled_model):
         device = get_device()
         size = sizes.dynamic if compiled_model.dynamic else sizes.static
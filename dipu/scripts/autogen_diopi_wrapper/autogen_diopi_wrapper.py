@@ -4,7 +4,7 @@ import re
 import json
 import os
 from collections import OrderedDict
-from typing import Mapping, Match, Optional, Sequence
+from typing import List, Mapping, Optional, Sequence
 from diopi_wrapper_template import (
     diopi_wrapper_file_template_content,
     diopi_wrapper_function_template_content,
@@ -23,6 +23,8 @@ class CodeTemplate:
 
     pattern: str
     filename: str
+    # pattern split once by substitution: [literal, indent, key, literal, ...]
+    segments: List[Optional[str]]
 
     @staticmethod
     def from_file(filename: str) -> "CodeTemplate":
@@ -32,6 +34,7 @@ class CodeTemplate:
     def __init__(self, pattern: str, filename: str = "") -> None:
         self.pattern = pattern
         self.filename = filename
+        self.segments = self.substitution.split(pattern)
 
     def substitute(
         self, env: Optional[Mapping[str, object]] = None, **kwargs: object
@@ -48,9 +51,7 @@ class CodeTemplate:
                 [indent + l + "\n" for e in v for l in str(e).splitlines()]
             ).rstrip()
 
-        def replace(match: Match[str]) -> str:
-            indent = match.group(1)
-            key = match.group(2)
+        def replace(indent: Optional[str], key: str) -> str:
             comma_before = ""
             comma_after = ""
             if key[0] == "{":
@@ -74,7 +75,12 @@ class CodeTemplate:
             else:
                 return str(v)
 
-        return self.substitution.sub(replace, self.pattern)
+        segments = self.segments
+        pieces = [segments[0]]
+        for i in range(1, len(segments), 3):
+            pieces.append(replace(segments[i], segments[i + 1]))
+            pieces.append(segments[i + 2])
+        return "".join(pieces)
 
 
 def get_fun_name_from_cppsignature(cppnature):
@@ -409,7 +415,6 @@ def create_cpp_signature_from_schema(schema):
     return_code = create_return_code_frome_schema(schema)
     fun_name = create_fun_name_from_schema(schema)
     param_list = create_param_list_from_schema(schema)
-    cppsignature_template = CodeTemplate("$return_code $fun_name($param_list)")
     cppsignature = cppsignature_template.substitute(
         return_code=[return_code], fun_name=[fun_name], param_list=[param_list]
     )
@@ -615,9 +620,8 @@ def create_get_saved_data_code(args_name_list):
     return code
 
 
-def create_optional_scalar_process_code(arg_name):
-    process_template = CodeTemplate(
-        """
+optional_scalar_process_template = CodeTemplate(
+    """
 ::diopiScalar_t ${arg_name}DiopiScalar;
 const ::diopiScalar_t* ${arg_name}DiopiScalarPtr = nullptr;
 if ($arg_name.has_value()) {
@@ -625,8 +629,11 @@ if ($arg_name.has_value()) {
     ${arg_name}DiopiScalarPtr = &${arg_name}DiopiScalar;
 }
 """
-    )
-    process_code = process_template.substitute(
+)
+
+
+def create_optional_scalar_process_code(arg_name):
+    process_code = optional_scalar_process_template.substitute(
         arg_name=[arg_name],
     )
     return process_code
@@ -661,13 +668,15 @@ def create_device_check_code(fun_config):
     return code
 
 
-def create_optional_generator_process_code(arg_name):
-    process_template = CodeTemplate(
-        """
+optional_generator_process_template = CodeTemplate(
+    """
 ::diopiGeneratorHandle_t ${arg_name}DiopiGenerator = (${arg_name}.has_value() && ${arg_name}.value().defined()) ? toDiopiGeneratorHandle(${arg_name}) : toDiopiGeneratorHandle(getDefaultDIPUGenerator());
 """
-    )
-    process_code = process_template.substitute(
+)
+
+
+def create_optional_generator_process_code(arg_name):
+    process_code = optional_generator_process_template.substitute(
         arg_name=[arg_name],
     )
     return process_code
@@ -675,6 +684,8 @@ def create_optional_generator_process_code(arg_name):
 
 file_template = CodeTemplate(diopi_wrapper_file_template_content)
 
+cppsignature_template = CodeTemplate("$return_code $fun_name($param_list)")
+
 fun_template = CodeTemplate(diopi_wrapper_function_template_content)
 
 op_no_customfallback_with_autocompare_register_template = CodeTemplate(
@@ -763,7 +774,6 @@ def functions_code_gen(fun_config):
             diopi_fun_call_code,
         )
 
-    cppsignature_template = CodeTemplate("$return_code $fun_name($param_list)")
     for scalar_param in get_function_optional_scalar_args_from_schema(
         fun_config["schema"]
     ):
@@ -3,6 +3,26 @@ import re
 import json
 import os
 import csv
+import functools
+import itertools
+import mmap
+import multiprocessing
+from collections import Counter, deque
+
+# the log is scanned as bytes straight from a mmap, everything stays bytes
+# until the csv is written
+# an op record is a head line "--[op_name]: diopi_fun" followed by its arg lines
+_OP_HEAD_PATTERN = re.compile(b"--\[.*\]: *[\w\d_]+ *\s")
+_OP_ARG_PATTERN = re.compile(b"[\t ]+[:\w\d_\.]+:.*\s")
+_OP_NAME_PATTERN = re.compile(b"(?<=(\-\-\[)).*(?=\])")
+_DIOPI_FUN_PATTERN = re.compile(b"[\w\d_]+")
+# data_ptr and storage_data_ptr differ between calls, strip both in one pass
+_DATA_PTR_PATTERN = re.compile(b", *(?:storage_)?data_ptr: 0x[\da-f]+")
+_FALLBACK_OP_PATTERN = re.compile(b"fallback to cpu, name=([\w\d_:\.]+)")
+# number of op records sent to a worker process at a time
+_OP_CHUNK_SIZE = 10_000
+# every worker holds its own _normalize_args cache, so the pool is kept small
+_MAX_PROCESSES = 8
 
 
 def boolean_string(s):
@@ -32,103 +52,185 @@ def parase_args():
     return args
 
 
-def get_all_op_from_train_log(log_content):
-    ops = re.findall(
-        "(?:--\[.*\]: *[\w\d_]+ *)\s(?:[\t ]+[:\w\d_\.]+:.*\s)*", log_content
-    )
-    return ops
-
-
-def extract_op_arg(op):
+def get_all_op_from_train_log(train_log):
+    # read line by line so that only one op record is held in memory
+    op = None
+    for line in train_log:
+        if op is not None:
+            if _OP_ARG_PATTERN.match(line):
+                op.append(line)
+                continue
+            yield b"".join(op)
+            op = None
+        head = _OP_HEAD_PATTERN.search(line)
+        if head is not None:
+            op = [line[head.start() :]]
+    if op is not None:
+        yield b"".join(op)
+
+
+# the same op is usually called with the same args over and over again,
+# so most records can skip the normalization. the pointers are stripped
+# before the lookup so that calls on different tensors share an entry
+@functools.lru_cache(maxsize=10_000)
+def _normalize_args(args):
     args_info = []
-    op_name = re.search("(?<=(\-\-\[)).*(?=\])", op).group().strip()
-    args = re.findall(f"(?<={op_name}:).*", op)
     for arg in args:
-        index = arg.find(":")
+        index = arg.find(b":")
         name = arg[0:index].strip()
         attrs = arg[index + 1 :]
-        attrs = re.sub(", *data_ptr: 0x[\da-f]+", "", attrs)
-        attrs = re.sub(", *storage_data_ptr: 0x[\da-f]+", "", attrs)
-        args_info.append(name + ":[" + attrs + "] ")
+        args_info.append(name + b":[" + attrs + b"] ")
+    return tuple(args_info)
 
-    return args_info
 
+def extract_op_arg(op):
+    args = []
+    op_name = _OP_NAME_PATTERN.search(op).group().strip()
+    # every arg line looks like "\t{op_name}:\t{arg_name}:{arg_info}"
+    prefix = op_name + b":"
+    for line in op.splitlines():
+        _, sep, arg = line.partition(prefix)
+        if sep:
+            args.append(_DATA_PTR_PATTERN.sub(b"", arg))
+
+    return _normalize_args(tuple(args))
 
-def extract_fallback_op_info(log_content):
-    aten_op_names = re.findall("fallback to cpu, name=([\w\d_:\.]+)", log_content)
-    aten_op_names = set(aten_op_names)
+
+def extract_fallback_op_info(aten_op_names):
     op_infos = []
     for name in aten_op_names:
         op_info = dict()
         op_info["aten_name"] = name
-        op_info["diopi_fun"] = "fallback"
-        op_info["args"] = "no"
+        op_info["diopi_fun"] = b"fallback"
+        op_info["args"] = b"no"
         op_infos.append(op_info)
     return op_infos
 
 
 def extract_op_info(op):
     op_info = dict()
-    op_name = re.search("(?<=(\-\-\[)).*(?=\])", op).group().strip()
+    op_name = _OP_NAME_PATTERN.search(op).group().strip()
     op_info["aten_name"] = op_name
-    op_info["diopi_fun"] = re.search("[\w\d_]+", op[op.find("]:") :]).group().strip()
+    op_info["diopi_fun"] = (
+        _DIOPI_FUN_PATTERN.search(op[op.find(b"]:") :]).group().strip()
+    )
     op_info["args"] = extract_op_arg(op)
     return op_info
 
 
-def unique_ops(op_infos):
-    op_infos_unique = []
-    op_infos_dict = dict()
+def _decode(value):
+    if isinstance(value, tuple):
+        return str([arg.decode("utf-8", "replace") for arg in value])
+    return value.decode("utf-8", "replace")
+
+
+def count_ops(op_infos):
+    counts = Counter()
+    diopi_fun_map = dict()
     for op_info in op_infos:
         op_name = op_info["aten_name"]
-        if op_name not in op_infos_dict:
-            op_infos_dict[op_name] = dict()
-            op_infos_dict[op_name]["diopi_fun"] = op_info["diopi_fun"]
-            op_infos_dict[op_name]["args"] = set()
-        op_infos_dict[op_name]["args"].add(str(op_info["args"]))
-    for name in op_infos_dict.keys():
-        for args in op_infos_dict[name]["args"]:
-            op_info = dict()
-            op_info["aten_name"] = name
-            op_info["diopi_fun"] = op_infos_dict[name]["diopi_fun"]
-            op_info["args"] = args
-            op_infos_unique.append(op_info)
-
+        counts[(op_name, op_info["args"])] += 1
+        diopi_fun_map.setdefault(op_name, op_info["diopi_fun"])
+    return counts, diopi_fun_map
+
+
+def _count_op_chunk(ops):
+    # runs in a worker process, only the counts are sent back
+    return count_ops(extract_op_info(op) for op in ops)
+
+
+def _merge_counts(results, counts, diopi_fun_map):
+    for chunk_counts, chunk_diopi_fun_map in results:
+        counts.update(chunk_counts)
+        for op_name, diopi_fun in chunk_diopi_fun_map.items():
+            diopi_fun_map.setdefault(op_name, diopi_fun)
+
+
+def _imap_bounded(pool, func, iterable, max_pending):
+    # pool.imap queues the whole iterable up front, this keeps at most
+    # max_pending chunks in flight and still yields the results in order
+    pending = deque()
+    for item in iterable:
+        pending.append(pool.apply_async(func, (item,)))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    chunk = list(itertools.islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, size))
+
+
+def unique_ops(counts, diopi_fun_map):
+    op_infos_unique = [
+        {
+            "aten_name": _decode(name),
+            "diopi_fun": _decode(diopi_fun_map[name]),
+            "args": _decode(args),
+            "count": count,
+        }
+        for (name, args), count in counts.items()
+    ]
     return op_infos_unique
 
 
-def op_capaure(log_content):
-    ops = get_all_op_from_train_log(log_content)
-    op_infos = []
-    for op in ops:
-        op_info = extract_op_info(op)
-        op_infos.append(op_info)
-    return op_infos
+def op_capaure(train_log):
+    fallback_op_names = set()
+
+    def collect_fallback_op_names(lines):
+        for line in lines:
+            fallback_op_names.update(_FALLBACK_OP_PATTERN.findall(line))
+            yield line
+
+    counts = Counter()
+    diopi_fun_map = dict()
+    ops = get_all_op_from_train_log(collect_fallback_op_names(train_log))
+    chunks = _chunks(ops, _OP_CHUNK_SIZE)
+    # peek two chunks, a log of a single chunk is counted in this process
+    first_chunks = list(itertools.islice(chunks, 2))
+    chunks = itertools.chain(first_chunks, chunks)
+    processes = min(os.cpu_count() or 1, _MAX_PROCESSES)
+    if processes < 2 or len(first_chunks) < 2:
+        _merge_counts(map(_count_op_chunk, chunks), counts, diopi_fun_map)
+    else:
+        # the chunks are merged in log order so that the output is the same
+        # as a sequential run
+        with multiprocessing.Pool(processes) as pool:
+            results = _imap_bounded(pool, _count_op_chunk, chunks, 2 * processes)
+            _merge_counts(results, counts, diopi_fun_map)
+
+    _merge_counts(
+        [count_ops(extract_fallback_op_info(fallback_op_names))],
+        counts,
+        diopi_fun_map,
+    )
+    return unique_ops(counts, diopi_fun_map)
 
 
 def main():
     args = parase_args()
-    with open(args.train_log) as train_log:
-        file_data = train_log.read()
-        op_infos = op_capaure(file_data)
-        op_infos += extract_fallback_op_info(file_data)
-        op_infos = unique_ops(op_infos)
+    # mmap refuses empty files
+    if os.path.getsize(args.train_log) <= 0:
+        return
+    with open(args.train_log, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        op_infos = op_capaure(iter(mm.readline, b""))
 
     if len(op_infos) <= 0:
         return
 
     with open(args.out, "w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f)
-        header = op_infos[0].keys()
-        writer.writerow(header)
-        rows = []
-
-        for op_info in op_infos:
-            r = []
-            for key in header:
-                r.append(op_info[key])
-            rows.append(r)
-        writer.writerows(rows)
+        writer = csv.DictWriter(
+            f, fieldnames=["aten_name", "diopi_fun", "args", "count"]
+        )
+        writer.writeheader()
+        writer.writerows(op_infos)
 
 
 if __name__ == "__main__":
@@ -2,9 +2,11 @@
 #include "RegisterDIPU.hpp"
 
 #include <algorithm>
+#include <array>
 #include <ios>
 #include <iostream>
 #include <regex>
+#include <string_view>
 
 #include <ATen/EmptyTensor.h>
 #include <ATen/core/op_registration/adaption.h>
@@ -99,15 +101,16 @@ void dipu_fallback(const c10::OperatorHandle& op, DispatchKeySet dispatch_keys,
 
   DIPU_OP_LOG_WARNING_ONCE("fallback to cpu, name=" << name << std::endl);
 
-  const static std::vector<std::string> custom_fallback_operators_list{
+  // keep sorted, it is binary searched on every fallback call
+  constexpr std::array<std::string_view, 3> custom_fallback_operators_list{
       "aten::native_batch_norm",
       "aten::native_batch_norm.out",
       "aten::native_batch_norm_backward",
   };
-  auto iter =
-      std::find(custom_fallback_operators_list.cbegin(),
-                custom_fallback_operators_list.cend(), std::string(name));
-  if (iter != custom_fallback_operators_list.cend() || forech_op) {
+  const bool custom_fallback = std::binary_search(
+      custom_fallback_operators_list.cbegin(),
+      custom_fallback_operators_list.cend(), std::string_view(name));
+  if (custom_fallback || forech_op) {
     dipu::native::cpu_fallback(op, stack);
   } else {
     at::native::cpu_fallback(op, stack);
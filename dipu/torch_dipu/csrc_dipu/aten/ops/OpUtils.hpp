@@ -21,6 +21,7 @@
 #include <ATen/ops/empty_strided.h>
 #include <c10/core/Device.h>
 #include <c10/core/ScalarType.h>
+#include <c10/macros/Macros.h>
 #include <c10/util/ArrayRef.h>
 #include <c10/util/Optional.h>
 #include <c10/util/OptionalArrayRef.h>
@@ -61,9 +62,10 @@ inline bool checkTensorDevice() {
   return enable;
 }
 
+// Called after every autogened op, off by default so that ops stay async.
 inline void synchronizeIfEnable() {
-  static const char* mode = std::getenv("DIPU_SYNC_EXEC_MODE");
-  if (mode != nullptr) {
+  static const bool enable = std::getenv("DIPU_SYNC_EXEC_MODE") != nullptr;
+  if (C10_UNLIKELY(enable)) {
     // TODO(log) - use a logger library to do this.
     // NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
     DIPU_LOG_ONCE << "The synchronous operation is performed after "
@@ -1,5 +1,6 @@
 #include "profiler.h"
 
+#include <atomic>
 #include <cstdio>
 #include <memory>
 #include <utility>
@@ -256,12 +257,14 @@ class DeviceRecordsImpl final {
   }
 };
 
+namespace detail {
 // NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
-bool gEnableFlag = false;
+std::atomic<bool> gEnableFlag{false};
+}  // namespace detail
 
-bool isEnable() { return gEnableFlag; }
-
-void setProfileOpen(bool profileFlag) { gEnableFlag = profileFlag; }
+void setProfileOpen(bool profileFlag) {
+  detail::gEnableFlag.store(profileFlag, std::memory_order_relaxed);
+}
 
 void FlushAllRecords() { DeviceRecordsImpl::get().flush(); }
 
@@ -1,5 +1,6 @@
 #pragma once
 
+#include <atomic>
 #include <cstdint>
 #include <list>
 #include <map>
@@ -10,6 +11,7 @@
 #include <utility>
 
 #include <c10/core/Stream.h>
+#include <c10/macros/Macros.h>
 #include <c10/util/Optional.h>
 #include <c10/util/string_view.h>
 
@@ -29,10 +31,20 @@ using string_t = std::string;
 //
 // ---------------------
 
+namespace detail {
+// only written by setProfileOpen(), toggled from python while other threads
+// may be running ops. it orders no other memory, so relaxed access is enough
+// NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
+extern std::atomic<bool> gEnableFlag;
+}  // namespace detail
+
 /*
  * get the global option
  */
-bool isEnable();
+// inline, every autogened op checks it twice even when profiling is off
+inline bool isEnable() {
+  return detail::gEnableFlag.load(std::memory_order_relaxed);
+}
 void setProfileOpen(bool profileFlag);
 
 void FlushAllRecords();
@@ -138,7 +150,7 @@ class RecordBlockCreator {
       c10::optional<deviceStream_t> stream = c10::nullopt,
       c10::optional<c10::StreamId> streamId = c10::nullopt,
       c10::optional<bool> enProfile = c10::nullopt) {
-    if (enProfile.value_or(isEnable())) {
+    if (C10_UNLIKELY(enProfile.value_or(isEnable()))) {
       if (!stream) {
         auto dipu_stream = getCurrentDIPUStream();
         if (!streamId) {